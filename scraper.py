@@ -1,7 +1,112 @@
-from urllib.parse import parse_qs, unquote, urljoin, urlparse
+from collections.abc import Mapping
+from urllib.parse import unquote_plus, urljoin, urlparse
+import argparse
+import asyncio
+import contextlib
+import functools
 import json
-
-from playwright.sync_api import sync_playwright
+import re
+import sys
+
+import httpx
+from playwright.async_api import Browser, BrowserContext, Playwright, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+CARTOON_URL = "https://ekantipur.com/cartoon"
+ENTERTAINMENT_URL = "https://ekantipur.com/entertainment"
+
+# Both section pages are server-rendered, so by default they are fetched as plain HTML.
+# A browser-like User-Agent avoids being served a bot/placeholder page.
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "ne,en;q=0.8",
+}
+
+# Only text and attribute values are scraped, so these never need to be downloaded.
+# Image URLs are still read from <img src> / data-* attributes in the parsed HTML.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# Chromium features a headless scraper never uses; turning them off means fewer
+# subprocesses, less memory, faster startup and no background fetches.
+CHROMIUM_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--no-first-run",
+    "--disable-features=Translate,BackForwardCache,MediaRouter",
+    "--mute-audio",
+]
+
+# <img> attributes that may hold the image URL directly, in order of preference
+# (the site may lazy-load with one of the data-* variants).
+IMG_SRC_ATTRS = ("src", "data-src", "data-original", "data-lazy")
+
+# How long the browser path waits for the cartoon image to be attached before giving up
+# on it; the rest of the cartoon is still extracted.
+CARTOON_IMG_TIMEOUT_MS = 5_000
+
+# Selectors shared by the static (selectolax) and browser (Playwright) extractors.
+# Semantic HTML is preferred over class names, which tend to change between redesigns.
+CARTOON_TITLE_SEL = "main h1, article h1"
+CARTOON_IMG_SEL = "main img, article img"
+ARTICLE_SEL = "main article"
+ARTICLE_TITLE_SEL = "h2 a"
+# Common patterns for category/tag links in news card UIs
+CATEGORY_SEL = 'a[href^="/tag/"], a[href^="/category/"], a[class*="tag"], a[class*="category"]'
+AUTHOR_SEL = 'a[href^="/author/"], a[href^="https://ekantipur.com/author/"]'
+
+# In-page extractors: each runs as a single `page.evaluate` / `locator.evaluate_all` call
+# (the latter receives every `ARTICLE_SEL` match) so the DOM is walked
+# inside the browser instead of one Playwright round-trip per field. The selectors are
+# passed in as the evaluate argument so they're defined once, above.
+CARTOON_EXTRACT_JS = """
+(sel) => {
+    const title = document.querySelector(sel.title);
+    const img = document.querySelector(sel.img);
+    const author = document.querySelector(sel.author);
+    return {
+        title: title?.textContent.trim() || null,
+        // All <img> attributes at once; the URL is picked in Python by _extract_img_src.
+        img: img ? Object.fromEntries(Array.from(img.attributes, a => [a.name, a.value])) : null,
+        cartoonist: author?.textContent.trim() || null,
+    };
+}
+"""
+
+ARTICLES_EXTRACT_JS = """
+(cards, sel) => cards.slice(0, 5).map(card => {
+    const title = card.querySelector(sel.title);
+    const category = card.querySelector(sel.category);
+    const author = card.querySelector(sel.author);
+    const img = card.querySelector(sel.img);
+    return {
+        title: title?.textContent.trim() || null,
+        category: category?.textContent.trim() || null,
+        author: author?.textContent.trim() || null,
+        // All <img> attributes at once; the URL is picked in Python by _extract_img_src.
+        img: img ? Object.fromEntries(Array.from(img.attributes, a => [a.name, a.value])) : null,
+    };
+})
+"""
+
+CARTOON_EXTRACT_ARG = {"title": CARTOON_TITLE_SEL, "img": CARTOON_IMG_SEL, "author": AUTHOR_SEL}
+ARTICLES_EXTRACT_ARG = {
+    "title": ARTICLE_TITLE_SEL,
+    "category": CATEGORY_SEL,
+    "author": AUTHOR_SEL,
+    "img": "img",
+}
+
+
+# The `src` parameter of a thumb.php query string (matched against `urlparse(...).query`,
+# which has no leading "?").
+_THUMB_SRC_RE = re.compile(r"(?:^|&)src=([^&]+)")
 
 
 def _first_url_from_srcset(srcset: str | None) -> str | None:
@@ -13,16 +118,33 @@ def _first_url_from_srcset(srcset: str | None) -> str | None:
     return first.split()[0].strip() if first else None
 
 
+def _extract_img_src(attrs: Mapping[str, str | None] | None) -> str | None:
+    """
+    Pick the image URL from an <img>'s attributes, handling lazy-loaded images that keep
+    the real URL in a data-* attribute and images that only provide a srcset.
+    """
+    if not attrs:
+        return None
+    for name in IMG_SRC_ATTRS:
+        if value := attrs.get(name):
+            return value
+    return _first_url_from_srcset(attrs.get("srcset") or attrs.get("data-srcset"))
+
+
+@functools.lru_cache(maxsize=512)
 def _resolve_to_absolute(base_url: str, maybe_url: str | None) -> str | None:
     """Resolve relative/protocol-relative URLs to an absolute URL."""
     if not maybe_url:
         return None
     u = maybe_url.strip()
+    if u.startswith(("http://", "https://")):
+        return u
     if u.startswith("//"):
         return "https:" + u
     return urljoin(base_url, u)
 
 
+@functools.lru_cache(maxsize=512)
 def _unwrap_thumb_php(maybe_thumb_url: str | None) -> str | None:
     """
     If the URL looks like a thumb.php?src=... wrapper, return the direct `src` URL.
@@ -31,188 +153,373 @@ def _unwrap_thumb_php(maybe_thumb_url: str | None) -> str | None:
     if not maybe_thumb_url:
         return None
     u = maybe_thumb_url.strip()
+    # Cheap substring test first: most URLs are not wrapped, so skip parsing them.
+    if "thumb.php" not in u:
+        return u
     parsed = urlparse(u)
     if not parsed.path.endswith("/thumb.php"):
         return u
-    qs = parse_qs(parsed.query)
-    src_vals = qs.get("src") or []
-    if not src_vals:
-        return u
-    
-    return unquote(src_vals[0]) or u
-
-
-def main():
-    # Start the Playwright context manager
-    with sync_playwright() as p:
-        # Launch Chromium browser in non-headless mode (visible window)
-        browser = p.chromium.launch(headless=False)
+    m = _THUMB_SRC_RE.search(parsed.query)
+    # unquote_plus, like parse_qs: a literal "+" in the query decodes to a space.
+    return unquote_plus(m.group(1)) if m else u
 
-        # Open a new browser context (like a separate user profile)
-        context = browser.new_context()
 
-        # Open a new page (tab) in the context
-        page = context.new_page()
+async def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for resources the scraper never looks at; let everything else through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
-        # Navigate to the ekantipur homepage
-        page.goto("https://ekantipur.com", wait_until="domcontentloaded")
-
-        # Avoid "networkidle" on news sites (they often keep long-polling/analytics open).
-        # Instead, wait for a basic, stable DOM element that indicates the page is rendered.
-        page.wait_for_load_state("load")
-        page.locator("body").wait_for(state="visible", timeout=30_000)
 
+async def scrape_cartoon(context: BrowserContext) -> dict[str, str | None]:
+    """Extract the Cartoon of the Day from its dedicated page in `context`."""
+    page = await context.new_page()
+    try:
         # --- Cartoon of the Day (homepage: व्यंग्यचित्र / कार्टुन) ---
         # Navigate to the dedicated cartoon page, which reliably represents
         # the current "Cartoon of the Day".
-        page.goto("https://ekantipur.com/cartoon", wait_until="domcontentloaded")
-        page.wait_for_load_state("load")
+        await page.goto(CARTOON_URL, wait_until="domcontentloaded")
 
-        # Wait for the main cartoon content to be visible (best-effort; don't crash if layout changes).
-        hero_img = page.locator("main img, article img").first
-        if hero_img.count() > 0:
-            hero_img.wait_for(state="visible", timeout=30_000)
+        # Wait only for the element we actually read next rather than a page-wide load state.
+        # No count() guard: with --render-js the image may only appear once client-side JS
+        # runs. Best-effort and kept short, so a page without an image just gets None from
+        # the extractor below instead of stalling.
+        try:
+            # "attached" rather than "visible": images are blocked, so the element never renders.
+            await page.locator(CARTOON_IMG_SEL).first.wait_for(state="attached", timeout=CARTOON_IMG_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass
 
-        # Title (cartoon headline) - return None if missing
-        cartoon_title: str | None = None
-        title_loc = page.locator("main h1, article h1").first
-        if title_loc.count() > 0:
-            t = title_loc.inner_text().strip()
-            cartoon_title = t or None
+        # Title, image URL and cartoonist in one round-trip; missing fields come back as None.
+        raw = await page.evaluate(CARTOON_EXTRACT_JS, CARTOON_EXTRACT_ARG)
 
         # Image URL (handle relative / lazy / srcset)
-        cartoon_img = page.locator("main img, article img").first
-        cartoon_src = None
-        if cartoon_img.count() > 0:
-            cartoon_src = cartoon_img.get_attribute("src")
-        if not cartoon_src and cartoon_img.count() > 0:
-            cartoon_src = (
-                cartoon_img.get_attribute("data-src")
-                or cartoon_img.get_attribute("data-original")
-                or cartoon_img.get_attribute("data-lazy")
-                or cartoon_img.get_attribute("data-srcset")
-            )
-        if not cartoon_src and cartoon_img.count() > 0:
-            cartoon_src = _first_url_from_srcset(cartoon_img.get_attribute("srcset"))
-
-        cartoon_image_url = _resolve_to_absolute(page.url, cartoon_src)
+        cartoon_image_url = _resolve_to_absolute(page.url, _extract_img_src(raw["img"]))
         # Ensure we return a direct/original image URL even if the site wraps it with thumb.php?src=...
         cartoon_image_url = _unwrap_thumb_php(cartoon_image_url)
+    finally:
+        await page.close()
 
-        # Cartoonist name (if present; otherwise None)
-        cartoonist: str | None = None
-        cartoon_author_loc = page.locator('a[href^="/author/"], a[href^="https://ekantipur.com/author/"]').first
-        if cartoon_author_loc.count() > 0:
-            text = cartoon_author_loc.inner_text().strip()
-            cartoonist = text or None
-
-        cartoon = {
-            "title": cartoon_title,
-            "image_url": cartoon_image_url,
-            "cartoonist": cartoonist,
-        }
+    return {
+        "title": raw["title"],
+        "image_url": cartoon_image_url,
+        "cartoonist": raw["cartoonist"],
+    }
 
-        print("\nCartoon of the Day:")
-        print(f"  title: {cartoon['title']}")
-        print(f"  image_url: {cartoon['image_url']}")
-        print(f"  cartoonist: {cartoon['cartoonist']}")
 
+async def scrape_entertainment(context: BrowserContext) -> list[dict[str, str | None]]:
+    """Extract the top 5 entertainment articles from the section page in `context`."""
+    page = await context.new_page()
+    try:
         # --- Entertainment section (top 5 articles) ---
         # Go to the entertainment section labeled “मनोरञ्जन”.
-        page.goto("https://ekantipur.com/entertainment", wait_until="domcontentloaded")
-        page.wait_for_load_state("load")
+        await page.goto(ENTERTAINMENT_URL, wait_until="domcontentloaded")
 
-        # Wait until at least one news article card is visible.
-        # Using semantic HTML (`article`) is typically more stable than class-based selectors.
-        page.locator("main article").first.wait_for(state="visible", timeout=30_000)
-
-        # Optional (still no extraction): ensure the first card has a clickable title link.
-        page.locator("main article h2 a").first.wait_for(state="visible", timeout=30_000)
+        # Wait until the first news article card has its title link visible before reading
+        # the cards. Using semantic HTML (`article`) is typically more stable than class-based
+        # selectors.
+        await page.locator(f"{ARTICLE_SEL} {ARTICLE_TITLE_SEL}").first.wait_for(state="visible", timeout=30_000)
 
         # Extract the top 5 entertainment articles as a list of dictionaries.
-        # We iterate per `article` card so fields stay aligned.
-        article_cards = page.locator("main article")
+        # The extractor walks each `article` card in-page so fields stay aligned.
+        raw_articles = await page.locator(ARTICLE_SEL).evaluate_all(ARTICLES_EXTRACT_JS, ARTICLES_EXTRACT_ARG)
         articles: list[dict[str, str | None]] = []
+        base_url = page.url
 
-        for i in range(5):
-            card = article_cards.nth(i)
-
-            # Title (headline link text)
-            title = card.locator("h2 a").first.inner_text().strip()
-
-            # Category/section label
-            # On the entertainment section page this is often implicitly "मनोरञ्जन", but we
-            # still attempt to find a per-card label if the UI provides one.
-            category: str | None = None
-            category_locator = card.locator(
-                # Common patterns for category/tag links in news card UIs
-                'a[href^="/tag/"], a[href^="/category/"], a[class*="tag"], a[class*="category"]'
-            ).first
-            if category_locator.count() > 0:
-                category_text = category_locator.inner_text().strip()
-                category = category_text or None
-            if category is None:
-                category = "मनोरञ्जन"
-
-            # Author name (return None if missing)
-            author: str | None = None
-            author_locator = card.locator('a[href^="/author/"], a[href^="https://ekantipur.com/author/"]').first
-            if author_locator.count() > 0:
-                author_text = author_locator.inner_text().strip()
-                author = author_text or None
-
+        for raw in raw_articles:
             # Thumbnail image URL (handle lazy-loaded/relative URLs)
-            img = card.locator("img").first
-            src = None
-            if img.count() > 0:
-                src = img.get_attribute("src")
-            if not src:
-                # Common lazy-load attributes (site may use one of these)
-                if img.count() > 0:
-                    src = (
-                        img.get_attribute("data-src")
-                        or img.get_attribute("data-original")
-                        or img.get_attribute("data-lazy")
-                        or img.get_attribute("data-srcset")
-                    )
-
-            if not src:
-                # If only srcset is present, take the first candidate URL
-                if img.count() > 0:
-                    src = _first_url_from_srcset(img.get_attribute("srcset"))
-
-            thumbnail_url = _resolve_to_absolute(page.url, src)
+            thumbnail_url = _resolve_to_absolute(base_url, _extract_img_src(raw["img"]))
 
             articles.append(
                 {
-                    "title": title,
+                    "title": raw["title"],
                     "image_url": thumbnail_url,
-                    "category": category,
-                    "author": author,
+                    # On the entertainment section page this is often implicitly "मनोरञ्जन"
+                    # when the card has no label of its own.
+                    "category": raw["category"] or "मनोरञ्जन",
+                    "author": raw["author"],
                 }
             )
+    finally:
+        await page.close()
+
+    return articles
 
-        # --- Write all extracted data to output.json ---
-        data = {
-            "cartoon": cartoon,
-            "entertainment_articles": articles,
-        }
 
-        output_path = "output.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+async def fetch(client: httpx.AsyncClient, url: str) -> tuple[str, LexborHTMLParser]:
+    """
+    Download `url` and return its final (post-redirect) URL and parsed HTML tree.
+    The final URL is what relative links on the page resolve against, like `page.url`.
+    """
+    response = await client.get(url)
+    response.raise_for_status()
+    return str(response.url), LexborHTMLParser(response.text)
 
-        # Show the contents of output.json after extraction.
-        print(f"\nWrote extracted data to {output_path}. Full contents:")
-        with open(output_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            # Safely print even if console encoding can't handle some characters.
-            safe_content = content.encode("cp1252", errors="replace").decode("cp1252")
-            print(safe_content)
+
+def _node_text(node: LexborNode | None) -> str | None:
+    """Return the stripped text of a selectolax node, or None if it is missing or empty."""
+    if node is None:
+        return None
+    return node.text().strip() or None
+
+
+def parse_cartoon(tree: LexborHTMLParser, base_url: str) -> dict[str, str | None]:
+    """Extract the Cartoon of the Day from the static HTML of the cartoon page."""
+    title = tree.css_first(CARTOON_TITLE_SEL)
+    img = tree.css_first(CARTOON_IMG_SEL)
+    author = tree.css_first(AUTHOR_SEL)
+
+    # Image URL (handle relative / lazy / srcset)
+    src = _extract_img_src(img.attributes if img is not None else None)
+    # Ensure we return a direct/original image URL even if the site wraps it with thumb.php?src=...
+    image_url = _unwrap_thumb_php(_resolve_to_absolute(base_url, src))
+
+    return {
+        "title": _node_text(title),
+        "image_url": image_url,
+        "cartoonist": _node_text(author),
+    }
+
+
+def parse_entertainment(tree: LexborHTMLParser, base_url: str) -> list[dict[str, str | None]]:
+    """Extract the top 5 entertainment articles from the static HTML of the section page."""
+    articles: list[dict[str, str | None]] = []
+
+    for card in tree.css(ARTICLE_SEL)[:5]:
+        title = card.css_first(ARTICLE_TITLE_SEL)
+        category = card.css_first(CATEGORY_SEL)
+        author = card.css_first(AUTHOR_SEL)
+
+        # Thumbnail image URL (handle lazy-loaded/relative URLs)
+        img = card.css_first("img")
+        src = _extract_img_src(img.attributes if img is not None else None)
+
+        articles.append(
+            {
+                "title": _node_text(title),
+                "image_url": _resolve_to_absolute(base_url, src),
+                # Fall back to the section name when the card has no label of its own.
+                "category": _node_text(category) or "मनोरञ्जन",
+                "author": _node_text(author),
+            }
+        )
+
+    return articles
+
+
+async def scrape_static() -> tuple[dict[str, str | None], list[dict[str, str | None]]]:
+    """Fetch both section pages concurrently over HTTP and parse them without a browser."""
+    async with httpx.AsyncClient(headers=HTTP_HEADERS, follow_redirects=True, timeout=30) as client:
+        (cartoon_url, cartoon_tree), (entertainment_url, entertainment_tree) = await asyncio.gather(
+            fetch(client, CARTOON_URL),
+            fetch(client, ENTERTAINMENT_URL),
+        )
+    return (
+        parse_cartoon(cartoon_tree, cartoon_url),
+        parse_entertainment(entertainment_tree, entertainment_url),
+    )
+
+
+async def _launch_browser(p: Playwright) -> Browser:
+    """Launch headless Chromium with the scraper-oriented flags."""
+    return await p.chromium.launch(
+        headless=True,
+        args=CHROMIUM_ARGS,
+        ignore_default_args=["--enable-automation"],
+    )
+
+
+async def _new_context(browser: Browser) -> BrowserContext:
+    """Open a browser context with heavy resources blocked."""
+    context = await browser.new_context(viewport={"width": 1280, "height": 720}, bypass_csp=True)
+    # Routing disables Chromium's HTTP cache for the context; skipping images, fonts and
+    # CSS saves more than the cache would.
+    await context.route("**/*", _block_heavy_resources)
+    return context
+
+
+async def scrape(context: BrowserContext) -> tuple[dict[str, str | None], list[dict[str, str | None]]]:
+    """Scrape both sections in `context`, each in its own page."""
+    # The cartoon and entertainment pages are independent, so overlap their
+    # navigations instead of visiting them one after another.
+    cartoon, articles = await asyncio.gather(
+        scrape_cartoon(context),
+        scrape_entertainment(context),
+    )
+    return cartoon, articles
+
+
+async def scrape_rendered() -> tuple[dict[str, str | None], list[dict[str, str | None]]]:
+    """Scrape both sections in headless Chromium, for pages that need JavaScript to render."""
+    # Start the Playwright context manager
+    async with async_playwright() as p:
+        browser = await _launch_browser(p)
+        # Both sections share one context and navigate concurrently in separate pages.
+        context = await _new_context(browser)
+        cartoon, articles = await scrape(context)
 
         # Close the browser context and the browser
-        context.close()
-        browser.close()
+        await context.close()
+        await browser.close()
+
+    return cartoon, articles
+
+
+def write_output(
+    cartoon: dict[str, str | None],
+    articles: list[dict[str, str | None]],
+    output_path: str = "output.json",
+) -> dict:
+    """Write the extracted data to `output_path` as UTF-8 JSON and return it."""
+    data = {
+        "cartoon": cartoon,
+        "entertainment_articles": articles,
+    }
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return data
+
+
+async def _scrape_worker(p: Playwright, browser: Browser, queue: asyncio.Queue[asyncio.Future]) -> None:
+    """
+    Serve queued scrape requests one at a time on the long-lived `browser`, relaunching
+    it if Chromium has gone away. The worker owns the browser and closes it on exit.
+    """
+    try:
+        while True:
+            result = await queue.get()
+            try:
+                if not browser.is_connected():
+                    # Chromium crashed or was killed; start a new one instead of failing
+                    # every request until the daemon is restarted.
+                    browser = await _launch_browser(p)
+                # A fresh context per scrape, so cookies/storage don't build up across requests.
+                context = await _new_context(browser)
+                try:
+                    cartoon, articles = await scrape(context)
+                finally:
+                    await context.close()
+                data = write_output(cartoon, articles)
+                # The requesting connection may have been dropped (and its future cancelled).
+                if not result.done():
+                    result.set_result(data)
+            except Exception as exc:
+                if not result.done():
+                    result.set_exception(exc)
+            finally:
+                queue.task_done()
+    finally:
+        if browser.is_connected():
+            await browser.close()
+
+
+async def _handle_http(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, queue: asyncio.Queue[asyncio.Future]
+) -> None:
+    """Minimal HTTP/1.1 handler: `POST /scrape` runs a scrape and returns output.json's contents."""
+    request_line = (await reader.readline()).decode("latin-1").split()
+    # Skip the headers; the request body (if any) is not used.
+    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+        pass
+
+    if request_line[:2] != ["POST", "/scrape"]:
+        status, payload = "404 Not Found", {"error": "only POST /scrape is supported"}
+    else:
+        result = asyncio.get_running_loop().create_future()
+        await queue.put(result)
+        try:
+            status, payload = "200 OK", await result
+        except Exception as exc:
+            status, payload = "500 Internal Server Error", {"error": str(exc)}
+
+    body = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    try:
+        writer.write(
+            (
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            + body
+        )
+        await writer.drain()
+    except ConnectionError:
+        # The client went away before the response was sent (output.json is still written).
+        pass
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def serve(host: str, port: int) -> None:
+    """
+    Keep Playwright and the browser running and scrape on demand, so repeated runs
+    (e.g. from cron: `curl -X POST http://127.0.0.1:8765/scrape`) skip the driver and
+    browser startup entirely.
+    """
+    async with async_playwright() as p:
+        browser = await _launch_browser(p)
+        queue: asyncio.Queue[asyncio.Future] = asyncio.Queue()
+        worker = asyncio.create_task(_scrape_worker(p, browser, queue))
+
+        server = await asyncio.start_server(
+            lambda reader, writer: _handle_http(reader, writer, queue), host, port
+        )
+        print(f"Serving on http://{host}:{port}/scrape (POST to scrape, Ctrl+C to stop)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # Cancelling the worker also closes whichever browser it is currently using.
+            worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+
+
+async def main():
+    # Print Nepali text as UTF-8 even where the console defaults to another encoding
+    # (e.g. cp1252 on Windows); anything it still can't show is replaced, not fatal.
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+    parser = argparse.ArgumentParser(description="Scrape the ekantipur cartoon and entertainment sections.")
+    parser.add_argument(
+        "--render-js",
+        action="store_true",
+        help="load the pages in headless Chromium instead of parsing the static HTML",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="keep headless Chromium running and scrape on each POST /scrape request",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on with --serve")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on with --serve")
+    args = parser.parse_args()
+
+    if args.serve:
+        await serve(args.host, args.port)
+        return
+
+    if args.render_js:
+        cartoon, articles = await scrape_rendered()
+    else:
+        cartoon, articles = await scrape_static()
+
+    print("\nCartoon of the Day:")
+    print(f"  title: {cartoon['title']}")
+    print(f"  image_url: {cartoon['image_url']}")
+    print(f"  cartoonist: {cartoon['cartoonist']}")
+
+    # --- Write all extracted data to output.json ---
+    output_path = "output.json"
+    data = write_output(cartoon, articles, output_path)
+
+    # Show what was written, straight from memory rather than reading the file back.
+    print(f"\nWrote extracted data to {output_path}. Full contents:")
+    print(json.dumps(data, ensure_ascii=False, indent=2))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())